@@ -18,3 +18,5 @@ for x in locals().copy().values():
     if hasattr(x, '__module__'):
         x.__module__ = __name__
 del x
+
+from .sanest import VAR  # noqa: E402,F401
@@ -3,6 +3,7 @@ import builtins
 import collections
 import collections.abc
 import copy
+import operator
 import pprint
 import reprlib
 import sys
@@ -21,6 +22,10 @@ except ImportError:  # pragma: no cover
 ATOMIC_TYPES = (bool, float, int, str)
 CONTAINER_TYPES = (builtins.dict, builtins.list)
 TYPES = CONTAINER_TYPES + ATOMIC_TYPES
+# sets for fast membership tests of types (not of type specs like [str])
+ATOMIC_TYPES_SET = frozenset(ATOMIC_TYPES)
+TYPES_SET = frozenset(TYPES)
+TYPE_NAMES = ', '.join(t.__name__ for t in TYPES)  # for error messages
 PATH_TYPES = (builtins.tuple, builtins.list)
 STRING_LIKE_TYPES = (str, bytes, bytearray)
 
@@ -28,6 +33,8 @@ typeof = builtins.type
 
 
 class Missing:
+    __slots__ = ()
+
     def __repr__(self):
         return '<missing>'
 
@@ -35,6 +42,19 @@ class Missing:
 MISSING = Missing()
 
 
+class Variable:
+    """
+    Placeholder for a variable path component in compiled accessors.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'sanest.VAR'
+
+
+VAR = Variable()
+
+
 class reprstr(str):
     """
     String with a repr() identical to str().
@@ -101,18 +121,23 @@ def validate_path(path):
     """Validate that ``path`` is a valid path."""
     if not path:
         raise InvalidPathError("empty path: {!r}".format(path))
-    if any(type(k) not in (int, str) for k in path):
-        raise InvalidPathError(
-            "path must contain only str or int: {!r}".format(path))
+    for k in path:
+        t = type(k)
+        if t is not str and t is not int:
+            raise InvalidPathError(
+                "path must contain only str or int: {!r}".format(path))
 
 
 def validate_type(type):
     """
     Validate that ``type`` is a valid argument for type checking purposes.
     """
-    if type in TYPES:
-        return
-    if typeof(type) is builtins.list and len(type) == 1 and type[0] in TYPES:
+    if typeof(type) is builtins.type:
+        # e.g. str, int (checked first: [str] cannot be in a set)
+        if type in TYPES_SET:
+            return
+    elif (typeof(type) is builtins.list and len(type) == 1
+            and type[0] in TYPES):
         # e.g. [str], [dict]
         return
     if typeof(type) is builtins.dict and len(type) == 1:
@@ -122,45 +147,92 @@ def validate_type(type):
             return
     raise InvalidTypeError(
         "expected {}, [...] (for lists) or {{str: ...}} (for dicts), got {}"
-        .format(', '.join(t.__name__ for t in TYPES), reprlib.repr(type)))
+        .format(TYPE_NAMES, reprlib.repr(type)))
 
 
 def validate_value(value):
     """
     Validate that ``value`` is a valid value.
-    """
-    if value is None:
-        return
-    if type(value) not in TYPES:
-        raise InvalidValueError(
-            "invalid value of type {.__name__}: {}"
-            .format(type(value), reprlib.repr(value)))
-    if type(value) is builtins.dict:
-        collections.deque(validated_items(value.items()), 0)  # fast looping
-    elif type(value) is builtins.list:
-        collections.deque(validated_values(value), 0)  # fast looping
-
 
-def validated_items(iterable):
-    """
-    Validate that the pairs in ``iterable`` are valid dict items.
+    Nested containers are validated as well. This uses an explicit
+    stack instead of recursion, which avoids a function call per value.
+    Containers that occur more than once, e.g. shared or cyclic ones,
+    are only validated once.
     """
-    for key, value in iterable:
-        if type(key) is not str:
-            raise InvalidPathError("invalid dict key: {!r}".format(key))
-        validate_value(value)
-        yield key, value
+    if value is None or type(value) in ATOMIC_TYPES_SET:
+        return  # no containers to walk
+    # local aliases avoid global lookups inside the loop
+    _type = type
+    _str = str
+    _dict = builtins.dict
+    _list = builtins.list
+    _types = TYPES_SET
+    stack = [(value,)]  # the value itself is checked like a list item
+    seen = set()  # ids of containers already on the stack
+    while stack:
+        container = stack.pop()
+        if _type(container) is _dict:
+            for key in container:
+                if _type(key) is not _str:
+                    raise InvalidPathError(
+                        "invalid dict key: {!r}".format(key))
+            container = container.values()
+        for value in container:
+            if value is None:
+                continue
+            t = _type(value)
+            if t is _dict or t is _list:
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    stack.append(value)
+            elif t not in _types:
+                raise InvalidValueError(
+                    "invalid value of type {.__name__}: {}"
+                    .format(t, reprlib.repr(value)))
 
 
 def validated_values(iterable):
     """
     Validate the values in ``iterable``.
     """
+    # local aliases avoid global lookups inside the loop
+    _validate_value = validate_value
     for value in iterable:
-        validate_value(value)
+        _validate_value(value)
         yield value
 
 
+def deepcopy_value(value, memo):
+    """
+    Make a deep copy of ``value``; like ``copy.deepcopy()``, but faster.
+
+    Only containers are copied since atomic values are immutable, so
+    ``value`` must not be ``None`` or an atomic value.
+    The ``memo`` dictionary works as for ``copy.deepcopy()``, which
+    preserves shared references and handles cycles.
+    """
+    t = type(value)
+    if t is builtins.dict:
+        result = memo.get(id(value))
+        if result is None:
+            result = memo[id(value)] = {}
+            for key, v in value.items():
+                if v is not None and type(v) not in ATOMIC_TYPES_SET:
+                    v = deepcopy_value(v, memo)
+                result[key] = v
+        return result
+    if t is builtins.list:
+        result = memo.get(id(value))
+        if result is None:
+            result = memo[id(value)] = []
+            for v in value:
+                if v is not None and type(v) not in ATOMIC_TYPES_SET:
+                    v = deepcopy_value(v, memo)
+                result.append(v)
+        return result
+    return copy.deepcopy(value, memo)  # not a sane value; be safe
+
+
 def pairs(*args, **kwargs):
     """
     Yield key/value pairs, handling args like the ``dict()`` built-in does.
@@ -172,9 +244,12 @@ def pairs(*args, **kwargs):
         if rest:
             raise TypeError(
                 "expected at most 1 argument, got {0:d}".format(len(args)))
-        if isinstance(other, collections.abc.Mapping):
+        t = type(other)
+        if t is builtins.dict:
             yield from other.items()
-        elif hasattr(other, "keys"):  # dict-like
+        elif t is sanest_dict or t is sanest_rodict:
+            yield from other._data.items()  # unwrapped values
+        elif hasattr(other, "keys"):  # mappings and other dict-likes
             for key in other.keys():
                 yield key, other[key]
         else:
@@ -186,31 +261,51 @@ def is_regular_list_slice(sl):
     """
     Tells whether ``sl`` looks like a regular ``list`` slice.
     """
+    start = sl.start
+    stop = sl.stop
+    step = sl.step
     return (
-        (sl.start is None or type(sl.start) is int)
-        and (sl.stop is None or type(sl.stop) is int)
-        and (sl.step is None or type(sl.step) is int))
+        (start is None or type(start) is int)
+        and (stop is None or type(stop) is int)
+        and (step is None or type(step) is int))
 
 
 def wrap(value, *, check=True):
     """
     Wrap a container (dict or list) without making a copy.
     """
-    if type(value) is builtins.dict:
-        return sanest_dict.wrap(value, check=check)
-    if type(value) is builtins.list:
-        return sanest_list.wrap(value, check=check)
+    wrapper = WRAPPERS.get(type(value))
+    if wrapper is not None:
+        return wrapper(value, check=check)
     raise TypeError("not a dict or list: {!r}".format(value))
 
 
+def iter_wrapped(values):
+    """
+    Iterate over ``values``, wrapping containers without checking them.
+    """
+    # local aliases avoid global lookups inside the loop
+    _type = type
+    get_wrapper = WRAPPERS.get
+    for value in values:
+        wrapper = get_wrapper(_type(value))
+        if wrapper is not None:
+            value = wrapper(value, check=False)
+        yield value
+
+
 def parse_path_like(path):
     """
     Parse a "path-like": a key, an index, or a path of these.
     """
-    if type(path) in (str, int):
+    t = type(path)
+    if t is str or t is int:
         return path, [path]
-    if type(path) in PATH_TYPES:
+    if t is builtins.tuple or t is builtins.list:
         validate_path(path)
+        # tuples become lists, as in parse_path_like_with_type().
+        if t is builtins.tuple:
+            path = builtins.list(path)
         return None, path
     raise InvalidPathError("invalid path: {!r}".format(path))
 
@@ -221,14 +316,16 @@ def parse_path_like_with_type(x, *, allow_slice=True):
     with an optional type.
     """
     sl = None
-    if typeof(x) in (int, str):
+    t = typeof(x)
+    if t is str or t is int:
         # e.g. d['a'] and d[2]
         key_or_index = x
         path = [key_or_index]
         type = None
-    elif allow_slice and typeof(x) is slice:
+    elif allow_slice and t is slice:
         sl = x
-        if typeof(sl.start) in PATH_TYPES:
+        t = typeof(sl.start)
+        if t is builtins.tuple or t is builtins.list:
             # e.g. d[path:str]
             key_or_index = None
             path = sl.start
@@ -237,21 +334,34 @@ def parse_path_like_with_type(x, *, allow_slice=True):
             # e.g. d['a':str] and d[2:str]
             key_or_index = sl.start
             path = [key_or_index]
-    elif typeof(x) in PATH_TYPES:
+            validate_path(path)
+    elif t is builtins.tuple or t is builtins.list:
         # e.g. d['a', 'b'] and d[path] and d['a', 'b':str]
+        for k in x:
+            tk = typeof(k)
+            if tk is not str and tk is not int:
+                break
+        else:
+            if x:
+                # fast path: plain path without type, validated in one pass.
+                # paths are never modified, so lists are used as is.
+                if t is builtins.tuple:
+                    x = builtins.list(x)
+                return None, x, None
         key_or_index = None
         path = builtins.list(x)  # makes a copy
         type = None
         if path:
             if allow_slice and typeof(path[-1]) is slice:
                 # e.g. d['a', 'b':str]
-                sl = path.pop()
-                if typeof(sl.start) in PATH_TYPES:
+                sl = path[-1]
+                t = typeof(sl.start)
+                if t is builtins.tuple or t is builtins.list:
                     raise InvalidPathError(
                         "mixed path syntaxes: {!r}".format(x))
-                path.append(sl.start)
-            elif not allow_slice:
-                # e.g. ['a', 'b', str]
+                path[-1] = sl.start
+            elif not allow_slice and typeof(path[-1]) not in (str, int):
+                # e.g. ['a', 'b', str], but not ['a', 'b']
                 try:
                     validate_type(path[-1])
                 except InvalidTypeError:
@@ -272,8 +382,8 @@ def parse_path_like_with_type(x, *, allow_slice=True):
         if sl.step is not None:
             raise InvalidPathError(
                 "step value not allowed for slice syntax: {!r}".format(x))
-    if type is not None:
         validate_type(type)
+    # note: a type from the ['a', 'b', str] syntax was validated above
     return key_or_index, path, type
 
 
@@ -293,28 +403,42 @@ def repr_for_type(type):
     raise ValueError("invalid type: {!r}".format(type))
 
 
-def check_type(value, *, type, path=None):
+def matches_type(value, *, type):
     """
-    Check that the type of ``value`` matches what ``type`` prescribes.
+    Tell whether the type of ``value`` matches what ``type`` prescribes.
     """
     # note: type checking is extremely strict: it avoids isinstance()
     # to avoid booleans passing as integers, and to avoid subclasses of
     # built-in types which will likely cause json serialisation errors
     # anyway.
-    if type in TYPES and typeof(value) is type:
+    if typeof(value) is type and type in TYPES_SET:
         # e.g. str, int
-        return
+        return True
     if typeof(type) is typeof(value) is builtins.list:
         # e.g. [str], [int]
         contained_type = type[0]
-        if all(typeof(v) is contained_type for v in value):
-            return
-        actual = "non-conforming list"
-    elif typeof(type) is typeof(value) is builtins.dict:
+        # counting matching types in C is faster than a Python loop
+        return (
+            operator.countOf(map(typeof, value), contained_type)
+            == len(value))
+    if typeof(type) is typeof(value) is builtins.dict:
         # e.g. {str: bool}
         contained_type = type[next(iter(type))]  # first dict value
-        if all(typeof(v) is contained_type for v in value.values()):
-            return
+        return (
+            operator.countOf(map(typeof, value.values()), contained_type)
+            == len(value))
+    return False
+
+
+def check_type(value, *, type, path=None):
+    """
+    Check that the type of ``value`` matches what ``type`` prescribes.
+    """
+    if matches_type(value, type=type):
+        return
+    if typeof(type) is typeof(value) is builtins.list:
+        actual = "non-conforming list"
+    elif typeof(type) is typeof(value) is builtins.dict:
         actual = "non-conforming dict"
     else:
         actual = typeof(value).__name__
@@ -334,16 +458,20 @@ def clean_value(value, *, type=None):
     """
     if type is not None:
         validate_type(type)
-    if typeof(value) in SANEST_CONTAINER_TYPES:
+    t = typeof(value)
+    if t in ATOMIC_TYPES_SET or value is None:
+        pass  # nothing to check or unwrap
+    elif t is sanest_dict or t is sanest_list:
         value = value._data
-    elif value is not None:
+    else:
         validate_value(value)
-    if type is not None:
+    # inlined check for the common case, e.g. str or int
+    if type is not None and typeof(value) is not type:
         check_type(value, type=type)
     return value
 
 
-def resolve_path(obj, path, *, partial=False, create=False):
+def resolve_path(obj, path, *, partial=False, create=False, missing_ok=False):
     """
     Resolve a ``path`` into ``obj``.
 
@@ -353,38 +481,202 @@ def resolve_path(obj, path, *, partial=False, create=False):
 
     Whecn ``create`` is ``True``, paths into non-existing dictionaries
     (but not into non-existing lists) are automatically created.
+
+    When ``missing_ok`` is ``True``, ``MISSING`` is returned for paths
+    that do not exist, instead of raising ``KeyError`` or ``IndexError``.
     """
-    if type(path[0]) is int and type(obj) is builtins.dict:
+    t_obj = type(obj)
+    t_key = type(path[0])
+    if t_key is int and t_obj is builtins.dict:
         raise InvalidPathError(
             "dict path must start with str: {!r}".format(path))
-    elif type(path[0]) is str and type(obj) is builtins.list:
+    elif t_key is str and t_obj is builtins.list:
         raise InvalidPathError(
             "list path must start with int: {!r}".format(path))
-    for n, key_or_index in enumerate(path):
-        if type(key_or_index) is str and type(obj) is not builtins.dict:
+    if t_obj is builtins.dict and len(path) == 2 and type(path[1]) is str:
+        # fast path for the common d['a', 'b'] case
+        key, tail = path
+        child = obj.get(key, MISSING)
+        if child is MISSING:
+            if missing_ok:
+                return MISSING
+            if not create:
+                raise KeyError(path[:1])
+            obj[key] = child = {}  # autovivification
+        if type(child) is not builtins.dict:
             raise InvalidStructureError(
                 "expected dict, got {.__name__} at subpath {!r} of {!r}"
-                .format(type(obj), path[:n], path))
-        if type(key_or_index) is int and type(obj) is not builtins.list:
-            raise InvalidStructureError(
-                "expected list, got {.__name__} at subpath {!r} of {!r}"
-                .format(type(obj), path[:n], path))
-        if partial and len(path) - 1 == n:
-            break
-        try:
-            obj = obj[key_or_index]  # may raise KeyError or IndexError
-        except KeyError:  # for dicts
-            if create:
-                obj[key_or_index] = obj = {}  # autovivification
-            else:
-                raise KeyError(path[:n+1]) from None
-        except IndexError:  # for lists
-            raise IndexError(path[:n+1]) from None
-    tail = path[-1]
+                .format(type(child), path[:1], path))
+        if partial:
+            return child, tail
+        value = child.get(tail, MISSING)
+        if value is MISSING:
+            if missing_ok:
+                return MISSING
+            raise KeyError(path)
+        return value
+    last = len(path) - 1 if partial else -1
+    # local aliases avoid global lookups inside the loop
+    _type = type
+    _str = str
+    _dict = builtins.dict
+    _list = builtins.list
+    for n, key_or_index in enumerate(path):
+        t_obj = _type(obj)
+        if _type(key_or_index) is _str:
+            if t_obj is not _dict:
+                raise InvalidStructureError(
+                    "expected dict, got {.__name__} at subpath {!r} of {!r}"
+                    .format(t_obj, path[:n], path))
+            if n == last:
+                break
+            value = obj.get(key_or_index, MISSING)
+            if value is MISSING:
+                if missing_ok:
+                    return MISSING
+                if not create:
+                    raise KeyError(path[:n+1])
+                obj[key_or_index] = value = {}  # autovivification
+            obj = value
+        else:  # int index
+            if t_obj is not _list:
+                raise InvalidStructureError(
+                    "expected list, got {.__name__} at subpath {!r} of {!r}"
+                    .format(t_obj, path[:n], path))
+            if n == last:
+                break
+            if missing_ok and not -len(obj) <= key_or_index < len(obj):
+                return MISSING
+            try:
+                obj = obj[key_or_index]
+            except IndexError:
+                raise IndexError(path[:n+1]) from None
     if partial:
-        return obj, tail
+        # the loop stopped at the last path component, the tail
+        return obj, key_or_index
+    return obj
+
+
+def lookup_path(obj, path):
+    """
+    Look up a ``path`` into ``obj``, returning ``MISSING`` instead of raising.
+
+    This is used by the fast paths for tuple lookups, e.g. ``d['a', 2]``.
+    Anything unusual (invalid path components, missing items, wrong
+    structure) results in ``MISSING``, and the caller then uses
+    ``resolve_path()`` via the regular code path, which raises the
+    appropriate exception.
+    """
+    # local aliases avoid global lookups inside the loop
+    _type = type
+    _str = str
+    _int = int
+    _dict = builtins.dict
+    _list = builtins.list
+    for key_or_index in path:
+        tk = _type(key_or_index)
+        to = _type(obj)
+        if tk is _str and to is _dict:
+            obj = obj.get(key_or_index, MISSING)
+            if obj is MISSING:
+                return MISSING
+        elif (tk is _int and to is _list
+                and -len(obj) <= key_or_index < len(obj)):
+            obj = obj[key_or_index]
+        else:
+            return MISSING
+    return obj
+
+
+def substitute_variables(path, values):
+    """
+    Fill in the ``VAR`` placeholders in ``path`` with ``values``.
+    """
+    values = iter(values)
+    return [next(values) if k is VAR else k for k in path]
+
+
+def compile_accessor(path, type, fallback):
+    """
+    Generate a function that looks up a fixed ``path`` (with optional type).
+
+    The generated code walks the path without any dispatching. On any
+    unexpected situation (missing item, wrong structure, wrong type) it
+    defers to ``fallback``, which performs a regular lookup that raises
+    the appropriate exception.
+
+    Each ``VAR`` in the path becomes an extra argument of the generated
+    function. The container type for such a step depends on the type
+    of the argument, so that check happens at call time.
+    """
+    variables = [
+        'var{}'.format(n) for n in range(sum(k is VAR for k in path))]
+    args = ''.join(', ' + v for v in variables)
+    call_fallback = "return fallback(obj{})".format(args)
+    lines = [
+        "def accessor(obj{}):".format(args),
+        "    value = obj._data",
+        "    try:",
+    ]
+    names = iter(variables)
+    for key_or_index in path:
+        if key_or_index is VAR:
+            name = next(names)
+            # e.g. a str argument must be looked up in a dict; anything
+            # else (e.g. bool) is handled, and rejected, by the fallback
+            expected = 'container_types.get(typeof({}))'.format(name)
+        else:
+            name = repr(key_or_index)
+            if typeof(key_or_index) is str:
+                expected = 'dict_type'
+            else:
+                expected = 'list_type'
+        # after a mismatch, value is MISSING, which skips all later steps
+        lines.append("        if typeof(value) is {}:".format(expected))
+        lines.append("            value = value[{}]".format(name))
+        lines.append("        else:")
+        lines.append("            value = MISSING")
+    # the fallback is called outside the exception handler, so that its
+    # exception does not show the internal one as its context.
+    lines.append("    except LookupError:")
+    lines.append("        value = MISSING")
+    lines.append("    if value is MISSING:")
+    lines.append("        " + call_fallback)
+    if type is None:
+        pass
+    elif typeof(type) is builtins.type:
+        lines.append("    if typeof(value) is not expected_type:")
+        lines.append("        " + call_fallback)
+    elif variables:
+        lines.append("    if not matches_type(value, type=expected_type):")
+        lines.append("        " + call_fallback)
     else:
-        return obj
+        lines.append("    check_type(value, type=expected_type, path=path)")
+    lines.extend([
+        "    t = typeof(value)",
+        "    if t is dict_type:",
+        "        return sanest_dict.wrap(value, check=False)",
+        "    if t is list_type:",
+        "        return sanest_list.wrap(value, check=False)",
+        "    return value",
+    ])
+    namespace = {
+        'MISSING': MISSING,
+        'check_type': check_type,
+        'container_types': {str: builtins.dict, int: builtins.list},
+        'dict_type': builtins.dict,
+        'expected_type': type,
+        'fallback': fallback,
+        'list_type': builtins.list,
+        'matches_type': matches_type,
+        'path': path,
+        'sanest_dict': sanest_dict,
+        'sanest_list': sanest_list,
+        'typeof': typeof,
+    }
+    code = compile('\n'.join(lines), '<sanest accessor>', 'exec')
+    exec(code, namespace)
+    return namespace['accessor']
 
 
 class FinalABCMeta(abc.ABCMeta):
@@ -424,18 +716,18 @@ class Collection(collections_abc_Collection):
         """
         Look up the item that ``path_like`` (with optional type) points to.
         """
-        if typeof(path_like) is self._key_or_index_type:  # fast path
-            try:
-                value = self._data[path_like]
-            except LookupError as exc:
-                raise typeof(exc)([path_like]) from None
-        else:
-            key_or_index, path, type = parse_path_like_with_type(path_like)
-            value = resolve_path(self._data, path)
-            if type is not None:
-                check_type(value, type=type, path=path)
-        if typeof(value) in CONTAINER_TYPES:
-            value = wrap(value, check=False)
+        # note: subclasses handle simple keys and indices in a fast path
+        key_or_index, path, type = parse_path_like_with_type(path_like)
+        value = resolve_path(self._data, path)
+        # inlined check for the common case, e.g. str or int
+        if type is not None and typeof(value) is not type:
+            check_type(value, type=type, path=path)
+        # inlined wrap(value, check=False)
+        t = typeof(value)
+        if t is builtins.dict:
+            return sanest_dict.wrap(value, check=False)
+        if t is builtins.list:
+            return sanest_list.wrap(value, check=False)
         return value
 
     def __eq__(self, other):
@@ -444,11 +736,12 @@ class Collection(collections_abc_Collection):
         """
         if self is other:
             return True
-        if type(other) is type(self):
+        t = type(other)
+        if t is type(self):
             if self._data is other._data:
                 return True
             return self._data == other._data
-        if type(other) in CONTAINER_TYPES:
+        if t is builtins.dict or t is builtins.list:
             return self._data == other
         return NotImplemented
 
@@ -485,7 +778,7 @@ class Collection(collections_abc_Collection):
     def __deepcopy__(self, memo):
         cls = type(self)
         obj = cls.__new__(cls)
-        obj._data = copy.deepcopy(self._data, memo)
+        obj._data = deepcopy_value(self._data, memo)
         return obj
 
     def copy(self, *, deep=False):
@@ -497,8 +790,51 @@ class Collection(collections_abc_Collection):
 
         :param deep bool: whether to make a deep copy
         """
-        fn = copy.deepcopy if deep else copy.copy
-        return fn(self)
+        if deep:
+            return self.__deepcopy__({})
+        return self.__copy__()
+
+    @classmethod
+    def compile_accessor(cls, path_like, *, type=None):
+        """
+        Make a fast lookup function for a fixed path.
+
+        The returned function takes a container as its first argument,
+        and behaves exactly like ``container[path_like:type]``, but
+        avoids parsing the path on every call. This is useful when the
+        same path is looked up many times, e.g. for many similar records.
+
+        The path may contain ``sanest.VAR`` placeholders. Their values
+        are passed as extra arguments, in order, when calling the
+        returned function, e.g. ``f(container, 'alice')`` for a path
+        like ``('users', sanest.VAR, 'age')``.
+
+        :param path_like: key, index, or path to look up
+        :param type: expected type
+        """
+        if type is not None:
+            validate_type(type)
+        if path_like is VAR:
+            path = [VAR]
+        elif (typeof(path_like) in PATH_TYPES
+                and any(k is VAR for k in path_like)):
+            path = builtins.list(path_like)  # private copy
+            for k in path:
+                t = typeof(k)
+                if k is not VAR and t is not str and t is not int:
+                    raise InvalidPathError(
+                        "path must contain only str, int, or sanest.VAR: {!r}"
+                        .format(path))
+        else:
+            _, path = parse_path_like(path_like)
+            path = builtins.list(path)  # private copy
+        if type is None:
+            def fallback(obj, *values):
+                return obj[substitute_variables(path, values)]
+        else:
+            def fallback(obj, *values):
+                return obj[substitute_variables(path, values):type]
+        return compile_accessor(path, type, fallback)
 
 
 class MutableCollection(Collection):
@@ -514,22 +850,40 @@ class MutableCollection(Collection):
         if typeof(path_like) is self._key_or_index_type:  # fast path
             obj = self._data
             key_or_index = path_like
-            path = [key_or_index]
-            value = clean_value(value)
+            path = None  # only needed for errors; see below
+            # inlined clean_value(value)
+            t = typeof(value)
+            if t in ATOMIC_TYPES_SET or value is None:
+                pass  # nothing to check or unwrap
+            elif t is sanest_dict or t is sanest_list:
+                value = value._data
+            else:
+                validate_value(value)
         else:
             key_or_index, path, type = parse_path_like_with_type(path_like)
-            value = clean_value(value, type=type)
+            # the type was validated while parsing; only check the value
+            value = clean_value(value)
+            if type is not None and typeof(value) is not type:
+                check_type(value, type=type)
             obj, key_or_index = resolve_path(
                 self._data, path, partial=True, create=True)
         try:
             obj[key_or_index] = value
-        except IndexError as exc:  # list assignment can fail
+        except IndexError:  # list assignment can fail
+            if path is None:
+                path = [key_or_index]
             raise IndexError(path) from None
 
     def __delitem__(self, path_like):
         """
         Delete the item that ``path_like`` (with optional type) points to.
         """
+        if typeof(path_like) is self._key_or_index_type:  # fast path
+            try:
+                del self._data[path_like]
+            except LookupError as exc:
+                raise typeof(exc)([path_like]) from None
+            return
         key_or_index, path, type = parse_path_like_with_type(path_like)
         obj, key_or_index = resolve_path(self._data, path, partial=True)
         try:
@@ -584,7 +938,7 @@ class Mapping(Collection, collections.abc.Mapping):
         if type(d) is not builtins.dict:
             raise TypeError("not a dict")
         if check:
-            collections.deque(validated_items(d.items()), 0)  # fast looping
+            validate_value(d)
         obj = cls.__new__(cls)
         obj._data = d
         return obj
@@ -614,6 +968,56 @@ class Mapping(Collection, collections.abc.Mapping):
         """
         return iter(self._data)
 
+    def __getitem__(self, path_like):
+        t = typeof(path_like)
+        if t is str:  # fast path
+            # e.g. d['a']
+            try:
+                value = self._data[path_like]
+            except KeyError:
+                raise KeyError([path_like]) from None
+        elif (t is builtins.tuple and path_like
+                and typeof(path_like[-1]) is not slice):  # fast path
+            # e.g. d['a', 'b'] and d['a', 2], with anything unusual (other
+            # syntax, missing items, wrong structure) handled by the slow
+            # path, which raises the appropriate exception. a typed path
+            # like d['a', 'b':str] goes to the slow path right away.
+            value = self._data
+            if (len(path_like) == 2 and typeof(path_like[0]) is str
+                    and typeof(path_like[1]) is str):
+                # unrolled loop for the most common case, e.g. d['a', 'b']
+                value = value.get(path_like[0], MISSING)
+                if typeof(value) is builtins.dict:
+                    value = value.get(path_like[1], MISSING)
+                else:
+                    value = MISSING
+            else:
+                value = lookup_path(value, path_like)
+            if value is MISSING:
+                return super().__getitem__(path_like)
+        elif (t is slice and typeof(path_like.start) is str
+                and typeof(path_like.stop) is builtins.type
+                and path_like.stop in TYPES_SET
+                and path_like.step is None):  # fast path
+            # e.g. d['a':str]
+            key = path_like.start
+            try:
+                value = self._data[key]
+            except KeyError:
+                raise KeyError([key]) from None
+            if typeof(value) is not path_like.stop:
+                check_type(value, type=path_like.stop, path=[key])
+        else:
+            return super().__getitem__(path_like)
+        t = typeof(value)
+        if t is builtins.dict:
+            return sanest_dict.wrap(value, check=False)
+        if t is builtins.list:
+            return sanest_list.wrap(value, check=False)
+        return value
+
+    __getitem__.__doc__ = Collection.__getitem__.__doc__
+
     def get(self, path_like, default=None, *, type=None):
         """
         Get a value or a default value; like ``dict.get()``.
@@ -627,17 +1031,21 @@ class Mapping(Collection, collections.abc.Mapping):
         key, path = parse_path_like(path_like)
         if typeof(path[-1]) is not str:
             raise InvalidPathError("path must lead to dict key")
-        try:
-            if typeof(key) is str:
-                value = self._data[key]
-            else:
-                value = resolve_path(self._data, path)
-        except LookupError:
+        if typeof(key) is str:
+            value = self._data.get(key, MISSING)
+        else:
+            value = resolve_path(self._data, path, missing_ok=True)
+        if value is MISSING:
             return default
-        if type is not None:
+        # inlined check for the common case, e.g. str or int
+        if type is not None and typeof(value) is not type:
             check_type(value, type=type, path=path)
-        if typeof(value) in CONTAINER_TYPES:
-            value = wrap(value, check=False)
+        # inlined wrap(value, check=False)
+        t = typeof(value)
+        if t is builtins.dict:
+            return sanest_dict.wrap(value, check=False)
+        if t is builtins.list:
+            return sanest_list.wrap(value, check=False)
         return value
 
     def __contains__(self, path_like):
@@ -651,14 +1059,12 @@ class Mapping(Collection, collections.abc.Mapping):
         # e.g. ['a', 'b'] and ['a', 'b', int] (slice syntax not possible)
         _, path, type = parse_path_like_with_type(path_like, allow_slice=False)
         try:
-            if type is None:
-                self[path]
-            else:
-                self[path:type]
-        except (LookupError, DataError):
+            value = resolve_path(self._data, path, missing_ok=True)
+        except DataError:
             return False
-        else:
-            return True
+        if value is MISSING:
+            return False
+        return type is None or matches_type(value, type=type)
 
     def keys(self):
         """
@@ -716,28 +1122,61 @@ class MutableMapping(
         :param default: default value to return for failed lookups
         :param type: expected type
         """
-        value = self.get(path_like, MISSING, type=type)
+        if type is not None:
+            validate_type(type)
+        key, path = parse_path_like(path_like)
+        if typeof(path[-1]) is not str:
+            raise InvalidPathError("path must lead to dict key")
+        if typeof(key) is str:
+            value = self._data.get(key, MISSING)
+        else:
+            value = resolve_path(self._data, path, missing_ok=True)
+        # inlined check for the common case, e.g. str or int
+        if (value is not MISSING and type is not None
+                and typeof(value) is not type):
+            check_type(value, type=type, path=path)
+        # check default value even if an existing value was found,
+        # so that this method is strict regardless of dict contents.
+        # the type itself was already validated above.
+        cleaned = clean_value(default)
+        if type is not None and typeof(cleaned) is not type:
+            check_type(cleaned, type=type)
         if value is MISSING:
-            # default value validation is done by set()
-            key, path = parse_path_like(path_like)
-            if type is None:
-                self[path] = default
+            if typeof(key) is str:
+                d = self._data
             else:
-                self[path:type] = default
+                d, key = resolve_path(
+                    self._data, path, partial=True, create=True)
+            d[key] = cleaned
             value = default
-            if typeof(value) in CONTAINER_TYPES:
-                value = wrap(value, check=False)
-        else:
-            # check default value even if an existing value was found,
-            # so that this method is strict regardless of dict contents.
-            clean_value(default, type=type)
+        wrapper = WRAPPERS.get(typeof(value))
+        if wrapper is not None:
+            value = wrapper(value, check=False)
         return value
 
     def update(self, *args, **kwargs):
         """
         Update with new items; like ``dict.update()``.
         """
-        self._data.update(validated_items(pairs(*args, **kwargs)))
+        if len(args) == 1 and not kwargs:
+            other = args[0]
+            t = type(other)
+            if t is sanest_dict or t is sanest_rodict:
+                # sanest dicts only contain valid values; no need to check.
+                self._data.update(other._data)
+                return
+            if t is builtins.dict:
+                # validate everything first, then update in bulk
+                validate_value(other)
+                self._data.update(other)
+                return
+        data = self._data
+        for key, value in pairs(*args, **kwargs):
+            if type(key) is not str:
+                raise InvalidPathError("invalid dict key: {!r}".format(key))
+            if value is not None:
+                validate_value(value)
+            data[key] = value
 
     def pop(self, path_like, default=MISSING, *, type=None):
         """
@@ -758,23 +1197,27 @@ class MutableMapping(
             _, path = parse_path_like(path_like)
             if typeof(path[-1]) is not str:
                 raise InvalidPathError("path must lead to dict key")
-            try:
-                d, key = resolve_path(self._data, path, partial=True)
-            except LookupError:
-                if default is MISSING:
-                    raise   # contains partial path in exception message
+            # without a default, the exception raised for a missing
+            # intermediate path contains the partial path in its message
+            result = resolve_path(
+                self._data, path, partial=True,
+                missing_ok=default is not MISSING)
+            if result is MISSING:
                 value = MISSING
             else:
+                d, key = result
                 value = d.get(key, MISSING)
         if value is MISSING:
             if default is MISSING:
                 raise KeyError(path) from None
             return default
-        if type is not None:
+        # inlined check for the common case, e.g. str or int
+        if type is not None and typeof(value) is not type:
             check_type(value, type=type, path=path)
         del d[key]
-        if typeof(value) in CONTAINER_TYPES:
-            value = wrap(value, check=False)
+        wrapper = WRAPPERS.get(typeof(value))
+        if wrapper is not None:
+            value = wrapper(value, check=False)
         return value
 
     def popitem(self, *, type=None):
@@ -817,9 +1260,12 @@ class DictKeysView(collections.abc.KeysView):
     def __repr__(self):
         return '{}.keys()'.format(self._mapping._truncated_repr())
 
+    def __iter__(self):
+        return iter(self._mapping._data)
+
 
 class DictValuesView(collections.abc.ValuesView):
-    __slots__ = ('_sanest_dict')
+    __slots__ = ('_sanest_dict',)
 
     def __init__(self, d):
         self._sanest_dict = d
@@ -835,14 +1281,11 @@ class DictValuesView(collections.abc.ValuesView):
             for v in self._sanest_dict._data.values())
 
     def __iter__(self):
-        for value in self._sanest_dict._data.values():
-            if type(value) in CONTAINER_TYPES:
-                value = wrap(value, check=False)
-            yield value
+        return iter_wrapped(self._sanest_dict._data.values())
 
 
 class DictItemsView(collections.abc.ItemsView):
-    __slots__ = ('_sanest_dict')
+    __slots__ = ('_sanest_dict',)
 
     def __init__(self, d):
         self._sanest_dict = d
@@ -862,9 +1305,13 @@ class DictItemsView(collections.abc.ItemsView):
             return v is value or v == value
 
     def __iter__(self):
+        # local aliases avoid global lookups inside the loop
+        _type = type
+        get_wrapper = WRAPPERS.get
         for key, value in self._sanest_dict._data.items():
-            if type(value) in CONTAINER_TYPES:
-                value = wrap(value, check=False)
+            wrapper = get_wrapper(_type(value))
+            if wrapper is not None:
+                value = wrapper(value, check=False)
             yield key, value
 
 
@@ -886,7 +1333,7 @@ class Sequence(Collection, collections.abc.Sequence):
         if type(l) is not builtins.list:
             raise TypeError("not a list")
         if check:
-            collections.deque(validated_values(l), 0)  # fast looping
+            validate_value(l)
         obj = cls.__new__(cls)
         obj._data = l
         return obj
@@ -914,10 +1361,7 @@ class Sequence(Collection, collections.abc.Sequence):
         """
         Iterate over the values in this list.
         """
-        for value in self._data:
-            if type(value) in CONTAINER_TYPES:
-                value = wrap(value, check=False)
-            yield value
+        return iter_wrapped(self._data)
 
     def iter(self, *, type=None):
         """
@@ -932,8 +1376,40 @@ class Sequence(Collection, collections.abc.Sequence):
         return iter(self)
 
     def __getitem__(self, path_like):
-        if type(path_like) is slice and is_regular_list_slice(path_like):
-            return sanest_list.wrap(self._data[path_like], check=False)
+        t = type(path_like)
+        if t is int:  # fast path
+            # e.g. l[2]
+            try:
+                value = self._data[path_like]
+            except IndexError:
+                raise IndexError([path_like]) from None
+            t = type(value)
+            if t is builtins.dict:
+                return sanest_dict.wrap(value, check=False)
+            if t is builtins.list:
+                return sanest_list.wrap(value, check=False)
+            return value
+        if t is slice:
+            # inlined is_regular_list_slice(path_like)
+            start = path_like.start
+            stop = path_like.stop
+            step = path_like.step
+            if ((start is None or type(start) is int)
+                    and (stop is None or type(stop) is int)
+                    and (step is None or type(step) is int)):
+                return sanest_list.wrap(self._data[path_like], check=False)
+        elif (t is builtins.tuple and path_like
+                and type(path_like[-1]) is not slice):  # fast path
+            # e.g. l[2, 'a'], with anything unusual handled by the slow
+            # path; see dict.__getitem__()
+            value = lookup_path(self._data, path_like)
+            if value is not MISSING:
+                t = type(value)
+                if t is builtins.dict:
+                    return sanest_dict.wrap(value, check=False)
+                if t is builtins.list:
+                    return sanest_list.wrap(value, check=False)
+                return value
         return super().__getitem__(path_like)
 
     __getitem__.__doc__ = Collection.__getitem__.__doc__
@@ -970,6 +1446,8 @@ class Sequence(Collection, collections.abc.Sequence):
         """
         Check whether ``value`` is contained in this list.
         """
+        if type(value) in ATOMIC_TYPES_SET:  # fast path
+            return value in self._data
         return clean_value(value) in self._data
 
     def contains(self, value, *, type=None):
@@ -1011,10 +1489,7 @@ class Sequence(Collection, collections.abc.Sequence):
         """
         Return an iterator in reversed order.
         """
-        for value in reversed(self._data):
-            if type(value) in CONTAINER_TYPES:
-                value = wrap(value, check=False)
-            yield value
+        return iter_wrapped(reversed(self._data))
 
     def __add__(self, other):
         """
@@ -1112,6 +1587,18 @@ class MutableSequence(
                 "expected iterable that is not string-like, got {.__name__}"
                 .format(typeof(iterable)))
         else:
+            t = typeof(iterable)
+            if (t is builtins.list or t is builtins.tuple) and type is None:
+                # unwrap and validate everything first, then extend in
+                # bulk, so that nothing is added if any value is invalid.
+                values = [
+                    v._data
+                    if typeof(v) is sanest_dict or typeof(v) is sanest_list
+                    else v
+                    for v in iterable]
+                validate_value(values)
+                self._data.extend(values)
+                return
             for value in iterable:
                 self.append(value, type=type)
 
@@ -1143,11 +1630,13 @@ class MutableSequence(
             value = ll[index]
         except IndexError:
             raise IndexError(path) from None
-        if type is not None:
+        # inlined check for the common case, e.g. str or int
+        if type is not None and typeof(value) is not type:
             check_type(value, type=type, path=path)
         del ll[index]
-        if typeof(value) in CONTAINER_TYPES:
-            value = wrap(value, check=False)
+        wrapper = WRAPPERS.get(typeof(value))
+        if wrapper is not None:
+            value = wrapper(value, check=False)
         return value
 
     def remove(self, value, *, type=None):
@@ -1206,3 +1695,9 @@ sanest_list = list
 sanest_rolist = rolist
 
 SANEST_CONTAINER_TYPES = (sanest_dict, sanest_list)
+
+# wrap() dispatch: maps container types to the matching wrap() method
+WRAPPERS = {
+    builtins.dict: sanest_dict.wrap,
+    builtins.list: sanest_list.wrap,
+}
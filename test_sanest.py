@@ -58,6 +58,10 @@ def test_parse_path_like_with_type_as_slice():
         x['a':int:str]
     assert str(excinfo.value).startswith(
         "step value not allowed for slice syntax: ")
+    with pytest.raises(sanest.InvalidPathError) as excinfo:
+        x[1.23:int]
+    assert str(excinfo.value) == (
+        "path must contain only str or int: [1.23]")
     with pytest.raises(sanest.InvalidPathError) as excinfo:
         x['a':None]
     assert str(excinfo.value).startswith("type is required for slice syntax: ")
@@ -73,6 +77,15 @@ def test_parse_path_like_with_type_in_list():
     assert f([path, str], allow_slice=False) == (None, ['a', 'b'], str)
 
 
+def test_parse_path_like_with_type_equal_but_invalid():
+    # paths that compare equal to valid ones must not be accepted
+    x = WithGetItem()
+    assert x['a', 1] == (None, ['a', 1], None)
+    for invalid in [True, 1.0]:
+        with pytest.raises(sanest.InvalidPathError):
+            x['a', invalid]
+
+
 #
 # type checking
 #
@@ -178,6 +191,11 @@ def test_pairs():
     expected = [("a", 1), ("b", 2)]
     assert actual == expected
 
+    actual = list(_sanest.pairs(sanest.dict({'a': {'b': 1}}), c=2))
+    expected = [("a", {'b': 1}), ("c", 2)]
+    assert actual == expected
+    assert type(actual[0][1]) is builtins.dict
+
     class WithKeys:
         def keys(self):
             yield "a"
@@ -352,6 +370,10 @@ def test_dict_typed_getitem_with_invalid_slice():
         d['a':int:str]
     assert str(excinfo.value).startswith(
         "step value not allowed for slice syntax: ")
+    with pytest.raises(sanest.InvalidPathError) as excinfo:
+        d[True:int]
+    assert str(excinfo.value) == (
+        "path must contain only str or int: [True]")
 
 
 def test_dict_getitem_with_path():
@@ -402,12 +424,81 @@ def test_dict_getitem_with_path_and_type():
     assert d['a':dict]
     path = ['a']
     assert d[path:dict]
+    d['a', 'c'] = [1]
+    assert isinstance(d['a', 'c':list], sanest.list)
 
     with pytest.raises(KeyError) as excinfo:
         d['x', 'y']
     assert str(excinfo.value) == "['x']"
 
 
+def test_dict_compile_accessor():
+    d = sanest.dict({'a': {'b': [{'c': 1}], 'd': 'x'}})
+    f = sanest.dict.compile_accessor('a')
+    assert f(d) == {'b': [{'c': 1}], 'd': 'x'}
+    assert isinstance(f(d), sanest.dict)
+    f = sanest.dict.compile_accessor(('a', 'b', 0, 'c'), type=int)
+    assert f(d) == 1
+    f = sanest.dict.compile_accessor(['a', 'b'], type=[dict])
+    assert isinstance(f(d), sanest.list)
+    f = sanest.dict.compile_accessor(['a', 'x'])
+    with pytest.raises(KeyError) as excinfo:
+        f(d)
+    assert str(excinfo.value) == "['a', 'x']"
+    assert excinfo.value.__context__ is None
+    f = sanest.dict.compile_accessor(['a', 'b', 5])
+    with pytest.raises(IndexError) as excinfo:
+        f(d)
+    assert str(excinfo.value) == "['a', 'b', 5]"
+    f = sanest.dict.compile_accessor(['a', 'd'], type=int)
+    with pytest.raises(sanest.InvalidValueError) as excinfo:
+        f(d)
+    assert str(excinfo.value) == (
+        "expected int, got str at path ['a', 'd']: 'x'")
+    f = sanest.dict.compile_accessor(['a', 'd', 'e'])
+    with pytest.raises(sanest.InvalidStructureError) as excinfo:
+        f(d)
+    assert str(excinfo.value) == (
+        "expected dict, got str at subpath ['a', 'd'] of ['a', 'd', 'e']")
+    with pytest.raises(sanest.InvalidTypeError):
+        sanest.dict.compile_accessor('a', type='oops')
+
+
+def test_compile_accessor_with_variables():
+    d = sanest.dict({
+        'users': {'alice': {'age': 33, 'tags': ['x']}},
+        'grid': [[1, 2], [3, 4]],
+    })
+    f = sanest.dict.compile_accessor(('users', sanest.VAR, 'age'), type=int)
+    assert f(d, 'alice') == 33
+    with pytest.raises(KeyError) as excinfo:
+        f(d, 'bob')
+    assert str(excinfo.value) == "['users', 'bob']"
+    assert excinfo.value.__context__ is None
+    with pytest.raises(sanest.InvalidPathError):
+        f(d, True)
+    with pytest.raises(TypeError):
+        f(d)
+    f = sanest.dict.compile_accessor(['grid', sanest.VAR, sanest.VAR])
+    assert f(d, 1, 0) == 3
+    assert f(d, -1, -1) == 4
+    with pytest.raises(sanest.InvalidStructureError):
+        f(d, 'a', 0)
+    f = sanest.dict.compile_accessor(('users', sanest.VAR, 'tags'), type=[int])
+    with pytest.raises(sanest.InvalidValueError) as excinfo:
+        f(d, 'alice')
+    assert str(excinfo.value) == (
+        "expected [int], got non-conforming list "
+        "at path ['users', 'alice', 'tags']: ['x']")
+    f = sanest.list.compile_accessor(sanest.VAR)
+    assert isinstance(f(d['grid'], 0), sanest.list)
+    with pytest.raises(sanest.InvalidPathError) as excinfo:
+        sanest.dict.compile_accessor(['users', sanest.VAR, 1.5])
+    assert str(excinfo.value) == (
+        "path must contain only str, int, or sanest.VAR: "
+        "['users', sanest.VAR, 1.5]")
+
+
 def test_dict_contains():
     d = sanest.dict()
     d['a'] = 1
@@ -466,6 +557,8 @@ def test_dict_get_with_path():
     assert d.get(('a', 'b')) == 123
     assert d.get(['a', 'c']) is None
     assert d.get(['b', 'c'], 456) == 456
+    d['a', 'd'] = [4]
+    assert isinstance(d.get(['a', 'd']), sanest.list)
 
 
 def test_dict_iteration():
@@ -494,6 +587,14 @@ def test_dict_setitem_with_path():
     path = ['a', 'b']
     d[path] = 456
     assert d[path] == 456
+    # missing intermediate dicts are created automatically
+    d['x', 'y', 'z'] = 1
+    d['p', 'q'] = 2
+    assert d == {'a': {'b': 456}, 'x': {'y': {'z': 1}}, 'p': {'q': 2}}
+    with pytest.raises(sanest.InvalidStructureError) as excinfo:
+        d['p', 'q', 'r'] = 3
+    assert str(excinfo.value) == (
+        "expected dict, got int at subpath ['p', 'q'] of ['p', 'q', 'r']")
 
 
 def test_dict_setitem_with_path_and_type():
@@ -543,6 +644,10 @@ def test_dict_setdefault():
         d.setdefault(['b', 'c'], 'not an int', type=int)
     assert str(excinfo.value) == (
         "expected int, got str at path ['b', 'c']: 'foo'")
+    with pytest.raises(sanest.InvalidValueError) as excinfo:
+        d.setdefault(('b', 'c'), 'not an int', type=int)
+    assert str(excinfo.value) == (
+        "expected int, got str at path ['b', 'c']: 'foo'")
 
     with pytest.raises(sanest.InvalidValueError) as excinfo:
         d.setdefault('x', 'not an int', type=int)
@@ -565,6 +670,25 @@ def test_dict_update():
     d['a'] = 1
     d.update({'a': 2}, b=3)
     assert d == {'a': 2, 'b': 3}
+    d.update(sanest.dict({'c': {'d': [1, 2]}}))
+    assert d == {'a': 2, 'b': 3, 'c': {'d': [1, 2]}}
+    d2 = sanest.dict(d)
+    assert d2 == d
+
+
+def test_dict_update_invalid():
+    d = sanest.dict({'a': 1})
+    with pytest.raises(sanest.InvalidPathError) as excinfo:
+        d.update({1: 2})
+    assert str(excinfo.value) == "invalid dict key: 1"
+    with pytest.raises(sanest.InvalidPathError) as excinfo:
+        d.update([(1, 2)])
+    assert str(excinfo.value) == "invalid dict key: 1"
+    with pytest.raises(sanest.InvalidValueError):
+        d.update([('b', object())])
+    with pytest.raises(sanest.InvalidValueError):
+        d.update(c=object())
+    assert d == {'a': 1}
 
 
 def test_dict_value_atomic_type():
@@ -832,6 +956,32 @@ def test_dict_deep_copy():
         assert other['b', 'b2'] == 22
 
 
+def test_dict_deep_copy_shared_references():
+    shared = {'x': [1, 2]}
+    shared_list = [3, {'y': 4}]
+    d = sanest.dict.wrap({
+        'a': shared, 'b': shared, 'c': [shared],
+        'd': shared_list, 'e': {'f': shared_list}})
+    other = d.copy(deep=True).unwrap()
+    assert other['a'] is not shared
+    assert other['a'] is other['b']
+    assert other['c'][0] is other['a']
+    assert other['d'] == shared_list
+    assert other['d'] is not shared_list
+    assert other['e']['f'] is other['d']
+
+
+def test_dict_deep_copy_unchecked_values():
+    class Thing:
+        pass
+    thing = Thing()
+    d = sanest.dict.wrap({'a': [thing], 'b': thing}, check=False)
+    other = copy.deepcopy(d).unwrap()
+    assert type(other['b']) is Thing
+    assert other['b'] is not thing
+    assert other['a'][0] is other['b']
+
+
 def test_dict_pickle():
     d1 = sanest.dict({'a': 1, 'b': {'b1': 21, 'b2': 22}})
     s = pickle.dumps(d1)
@@ -1109,6 +1259,31 @@ def test_list_wrap_validation():
     assert len(ll) == 2
 
 
+def test_list_wrap_validation_deeply_nested():
+    original = nested = []
+    for _ in range(sys.getrecursionlimit() + 100):
+        nested.append({'a': None})
+        nested.append([])
+        nested = nested[-1]
+    sanest.list.wrap(original)
+    nested.append(MyClass())
+    with pytest.raises(sanest.InvalidValueError):
+        sanest.list.wrap(original)
+
+
+def test_wrap_validation_cyclic():
+    ll = []
+    ll.append(ll)
+    ll.append({'a': ll})
+    sanest.list.wrap(ll)  # must not loop forever
+    ll.append(MyClass())
+    with pytest.raises(sanest.InvalidValueError):
+        sanest.list.wrap(ll)
+    d = {}
+    d['d'] = d
+    sanest.dict.wrap(d)
+
+
 def test_list_validate():
     ll = sanest.list([1, 2, 3])
     ll.check_types(type=int)
@@ -1126,6 +1301,9 @@ def test_list_getitem():
     with pytest.raises(IndexError) as excinfo:
         ll[2]
     assert str(excinfo.value) == "[2]"
+    ll = sanest.list([['a'], {'b': 2}])
+    assert isinstance(ll[0], sanest.list)
+    assert isinstance(ll[1], sanest.dict)
 
 
 def test_list_getitem_with_type():
@@ -1153,6 +1331,21 @@ def test_list_getitem_with_path():
         "expected list, got str at subpath [0] of [0, 9]")
 
 
+def test_list_getitem_with_path_into_dict():
+    ll = sanest.list([{'a': {'b': 2}, 'c': [3]}])
+    d = ll[0, 'a']
+    assert isinstance(d, sanest.dict)
+    assert d == {'b': 2}
+    assert ll[0, 'a', 'b'] == 2
+    assert isinstance(ll[0, 'c'], sanest.list)
+    assert ll[-1, 'c', -1] == 3
+    with pytest.raises(KeyError) as excinfo:
+        ll[0, 'missing']
+    assert str(excinfo.value) == "[0, 'missing']"
+    with pytest.raises(sanest.InvalidPathError):
+        ll[0, 'a', True]
+
+
 def test_list_getitem_with_path_and_type():
     ll = sanest.list(['a', ['b1', 'b2']])
     assert ll[1, 0:str] == "b1"
@@ -1180,6 +1373,9 @@ def test_list_setitem_with_type():
     with pytest.raises(sanest.InvalidValueError) as excinfo:
         ll[0:bool] = 'a'
     assert str(excinfo.value) == "expected bool, got str: 'a'"
+    with pytest.raises(IndexError) as excinfo:
+        ll[5:str] = 'a'
+    assert str(excinfo.value) == "[5]"
 
 
 def test_list_setitem_with_path():
@@ -1251,6 +1447,12 @@ def test_list_iteration():
     assert isinstance(second, sanest.list)
     assert second == [2, 3]
     assert third == 'x'
+    # containers added while iterating are wrapped as well
+    ll = sanest.list([1])
+    for value in ll:
+        if value == 1:
+            ll.append({})
+    assert isinstance(value, sanest.dict)
 
 
 def test_list_iteration_with_type():
@@ -1350,6 +1552,28 @@ def test_list_extend():
     assert str(excinfo.value) == "invalid value of type MyClass: <MyClass>"
     ll.extend(n for n in [7, 8])
     assert ll == [1, 2, 3, 4, 5, 6, 7, 8]
+    ll.extend((9, [10]))
+    assert ll == [1, 2, 3, 4, 5, 6, 7, 8, 9, [10]]
+    with pytest.raises(sanest.InvalidValueError):
+        ll.extend((11, MyClass()))
+    assert ll == [1, 2, 3, 4, 5, 6, 7, 8, 9, [10]]
+
+
+def test_list_extend_unchanged_on_error():
+    ll = sanest.list([1])
+    with pytest.raises(sanest.InvalidPathError):
+        ll.extend([2, {1: 2}])
+    assert ll == [1]
+    with pytest.raises(sanest.InvalidValueError):
+        ll.extend([2, MyClass()])
+    assert ll == [1]
+    with pytest.raises(sanest.InvalidValueError):
+        ll.extend([sanest.dict({'a': 2}), [MyClass()]])
+    assert ll == [1]
+    ll.extend([sanest.dict({'a': 2}), sanest.list([3])])
+    assert ll == [1, {'a': 2}, [3]]
+    assert type(ll.unwrap()[1]) is dict
+    assert type(ll.unwrap()[2]) is list
 
 
 @pytest.mark.parametrize(
@@ -1442,6 +1666,8 @@ def test_list_reversing():
     assert ll == ['a', {}]
     ll.reverse()
     assert ll == [{}, 'a']
+    ll = sanest.list(['a', 'b'])
+    assert list(reversed(ll)) == ['b', 'a']
 
 
 def test_list_clear():
@@ -1676,6 +1902,9 @@ def test_slots():
     ll = sanest.list()
     with pytest.raises(AttributeError):
         ll.foo = 123
+    for obj in [d.keys(), d.values(), d.items(), _sanest.MISSING]:
+        with pytest.raises(AttributeError):
+            obj.foo = 123
 
 
 def dedent(s):